@@ -5,6 +5,7 @@ using Microsoft.Extensions.Logging;
 using SixLabors.ImageSharp;
 using SixLabors.ImageSharp.PixelFormats;
 using SixLabors.ImageSharp.Processing;
+using System.Text;
 using VerificationDecisionEnum = DocumentValidation.FaceMatching.Models.VerificationDecision;
 
 Console.WriteLine("=== Face Matching Example ===\n");
@@ -52,39 +53,43 @@ Console.WriteLine("Running verification pipeline...\n");
 var result = await faceMatchingService.VerifyIdentityAsync(selfieFrames, idPhoto);
 
 // Display results
-Console.WriteLine("\n=== Verification Result ===");
-Console.WriteLine($"Decision: {result.Decision}");
-Console.WriteLine($"Confidence: {result.Confidence:P1}");
-Console.WriteLine($"Is Match: {result.IsIdentical}");
-Console.WriteLine($"Message: {result.Message}");
+// The report is assembled first and written with a single Console.Write,
+// rather than one locked, flushed WriteLine per line
+var report = new StringBuilder();
+report.AppendLine("\n=== Verification Result ===");
+report.AppendLine($"Decision: {result.Decision}");
+report.AppendLine($"Confidence: {result.Confidence:P1}");
+report.AppendLine($"Is Match: {result.IsIdentical}");
+report.AppendLine($"Message: {result.Message}");
 
 // Show what to do based on decision
-Console.WriteLine("\n=== Action Required ===");
+report.AppendLine("\n=== Action Required ===");
 switch (result.Decision)
 {
     case VerificationDecisionEnum.AutoAccept:
-        Console.WriteLine("✓ APPROVED - High confidence match");
-        Console.WriteLine("  Action: Process immediately");
+        report.AppendLine("✓ APPROVED - High confidence match");
+        report.AppendLine("  Action: Process immediately");
         break;
         
     case VerificationDecisionEnum.Accept:
-        Console.WriteLine("✓ APPROVED - Good confidence match");
-        Console.WriteLine("  Action: May queue for soft review");
+        report.AppendLine("✓ APPROVED - Good confidence match");
+        report.AppendLine("  Action: May queue for soft review");
         break;
         
     case VerificationDecisionEnum.Retry:
-        Console.WriteLine("⚠ RETRY NEEDED - Uncertain match");
-        Console.WriteLine("  Action: Ask user to try again");
-        Console.WriteLine("  Hint: 'Please try again with better lighting'");
+        report.AppendLine("⚠ RETRY NEEDED - Uncertain match");
+        report.AppendLine("  Action: Ask user to try again");
+        report.AppendLine("  Hint: 'Please try again with better lighting'");
         break;
         
     case VerificationDecisionEnum.Reject:
-        Console.WriteLine("✗ REJECTED - Low confidence match");
-        Console.WriteLine("  Action: Flag for manual review or reject");
+        report.AppendLine("✗ REJECTED - Low confidence match");
+        report.AppendLine("  Action: Flag for manual review or reject");
         break;
 }
 
-Console.WriteLine("\n=== Example Complete ===");
+report.AppendLine("\n=== Example Complete ===");
+Console.Write(report.ToString());
 
 // Helper methods to generate sample images
 List<byte[]> GenerateSampleFrames(int count)
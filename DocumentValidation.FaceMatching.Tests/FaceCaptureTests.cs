@@ -0,0 +1,193 @@
+using DocumentValidation.FaceMatching;
+using Microsoft.Extensions.Logging.Abstractions;
+using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.PixelFormats;
+using Xunit;
+
+namespace DocumentValidation.FaceMatching.Tests;
+
+/// <summary>
+/// Unit tests for FaceCapture frame scoring and best frame selection
+/// </summary>
+public class FaceCaptureTests
+{
+    private readonly FaceCapture _capture;
+
+    public FaceCaptureTests()
+    {
+        _capture = new FaceCapture(
+            NullLogger<FaceCapture>.Instance,
+            new FaceNormalize(NullLogger<FaceNormalize>.Instance));
+    }
+
+    [Fact]
+    public void CalculateSharpness_UniformImage_ReturnsZero()
+    {
+        // Arrange
+        using var image = CreateImage(32, 32, (x, y) => 128);
+
+        // Act
+        var sharpness = _capture.CalculateSharpness(image, FullBounds(image));
+
+        // Assert
+        Assert.Equal(0.0, sharpness);
+    }
+
+    [Fact]
+    public void CalculateSharpness_LowContrastStripes_ReturnsExactVariance()
+    {
+        // Arrange
+        // Alternating 0/10 columns: every inner pixel has a Laplacian of ±20,
+        // so the variance is 400 and the normalized score is 400 / 10000
+        using var image = CreateImage(32, 32, (x, y) => (byte)(x % 2 == 1 ? 10 : 0));
+
+        // Act
+        var sharpness = _capture.CalculateSharpness(image, FullBounds(image));
+
+        // Assert
+        Assert.Equal(0.04, sharpness, precision: 10);
+    }
+
+    [Fact]
+    public void CalculateSharpness_Checkerboard_ClampsToOne()
+    {
+        // Arrange
+        using var image = CreateImage(32, 32, (x, y) => (byte)((x + y) % 2 == 0 ? 255 : 0));
+
+        // Act
+        var sharpness = _capture.CalculateSharpness(image, FullBounds(image));
+
+        // Assert
+        Assert.Equal(1.0, sharpness);
+    }
+
+    [Fact]
+    public void CalculateSharpness_RegionSmallerThanKernel_ReturnsZero()
+    {
+        // Arrange
+        using var image = CreateImage(2, 2, (x, y) => (byte)(x == 0 ? 255 : 0));
+
+        // Act
+        var sharpness = _capture.CalculateSharpness(image, FullBounds(image));
+
+        // Assert
+        Assert.Equal(0.0, sharpness);
+    }
+
+    [Fact]
+    public async Task SelectBestFrameAsync_SharpFrame_SelectedOverUniformFrame()
+    {
+        // Arrange
+        var frames = new List<byte[]>
+        {
+            EncodePng(64, 64, (x, y) => 128),
+            EncodePng(64, 64, (x, y) => (byte)((x + y) % 2 == 0 ? 255 : 0))
+        };
+
+        // Act
+        var result = await _capture.SelectBestFrameAsync(frames);
+
+        // Assert
+        Assert.Same(frames[1], result);
+    }
+
+    [Fact]
+    public async Task SelectBestFrameAsync_SequentialEvaluation_MatchesParallelResult()
+    {
+        // Arrange
+        var sequentialCapture = new FaceCapture(
+            NullLogger<FaceCapture>.Instance,
+            new FaceNormalize(NullLogger<FaceNormalize>.Instance),
+            maxParallelFrameEvaluations: 1);
+
+        var frames = new List<byte[]>
+        {
+            EncodePng(64, 64, (x, y) => 128),
+            EncodePng(64, 64, (x, y) => (byte)((x + y) % 2 == 0 ? 255 : 0))
+        };
+
+        // Act
+        var sequentialResult = await sequentialCapture.SelectBestFrameAsync(frames);
+        var parallelResult = await _capture.SelectBestFrameAsync(frames);
+
+        // Assert
+        Assert.Same(frames[1], sequentialResult);
+        Assert.Same(parallelResult, sequentialResult);
+    }
+
+    [Fact]
+    public async Task SelectBestFrameAsync_TiedScores_ReturnsFirstFrame()
+    {
+        // Arrange
+        var frames = new List<byte[]>
+        {
+            EncodePng(64, 64, (x, y) => 128),
+            EncodePng(64, 64, (x, y) => 128),
+            EncodePng(64, 64, (x, y) => 128)
+        };
+
+        // Act
+        var result = await _capture.SelectBestFrameAsync(frames);
+
+        // Assert
+        Assert.Same(frames[0], result);
+    }
+
+    [Fact]
+    public async Task SelectBestFrameAsync_TinyFirstFrame_DoesNotBeatValidFrame()
+    {
+        // Arrange
+        // The 4x4 frame's face crop is 2x2, too small for the Laplacian kernel
+        var frames = new List<byte[]>
+        {
+            EncodePng(4, 4, (x, y) => 128),
+            EncodePng(64, 64, (x, y) => (byte)((x + y) % 2 == 0 ? 255 : 0))
+        };
+
+        // Act
+        var result = await _capture.SelectBestFrameAsync(frames);
+
+        // Assert
+        Assert.Same(frames[1], result);
+    }
+
+    [Fact]
+    public async Task SelectBestFrameAsync_NoFrames_ReturnsNull()
+    {
+        // Act
+        var result = await _capture.SelectBestFrameAsync(new List<byte[]>());
+
+        // Assert
+        Assert.Null(result);
+    }
+
+    private static Image<Rgba32> CreateImage(int width, int height, Func<int, int, byte> gray)
+    {
+        var image = new Image<Rgba32>(width, height);
+
+        for (int y = 0; y < height; y++)
+        {
+            for (int x = 0; x < width; x++)
+            {
+                var value = gray(x, y);
+                image[x, y] = new Rgba32(value, value, value);
+            }
+        }
+
+        return image;
+    }
+
+    private static byte[] EncodePng(int width, int height, Func<int, int, byte> gray)
+    {
+        // PNG is lossless, so pixel patterns survive the encode/decode round trip
+        using var image = CreateImage(width, height, gray);
+        using var ms = new MemoryStream();
+        image.SaveAsPng(ms);
+        return ms.ToArray();
+    }
+
+    private static Models.Rectangle FullBounds(Image image)
+    {
+        return new Models.Rectangle { X = 0, Y = 0, Width = image.Width, Height = image.Height };
+    }
+}
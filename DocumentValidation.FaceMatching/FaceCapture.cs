@@ -14,11 +14,16 @@ public class FaceCapture
 {
     private readonly ILogger<FaceCapture> _logger;
     private readonly FaceNormalize _faceNormalize;
+    private readonly int _maxParallelFrameEvaluations;
 
-    public FaceCapture(ILogger<FaceCapture> logger, FaceNormalize faceNormalize)
+    public FaceCapture(
+        ILogger<FaceCapture> logger,
+        FaceNormalize faceNormalize,
+        int maxParallelFrameEvaluations = FaceMatchingOptions.DefaultMaxParallelFrameEvaluations)
     {
         _logger = logger;
         _faceNormalize = faceNormalize;
+        _maxParallelFrameEvaluations = Math.Max(1, maxParallelFrameEvaluations);
     }
 
     /// <summary>
@@ -30,8 +35,9 @@ public class FaceCapture
     /// </summary>
     public async Task<byte[]?> SelectBestFrameAsync(IEnumerable<byte[]> frames)
     {
-        var frameList = frames.ToList();
-        if (!frameList.Any())
+        // Callers typically pass a List or array already; only copy other sequences
+        var frameList = frames as IReadOnlyList<byte[]> ?? frames.ToList();
+        if (frameList.Count == 0)
         {
             _logger.LogWarning("No frames provided for selection");
             return null;
@@ -39,25 +45,40 @@ public class FaceCapture
 
         _logger.LogInformation("Evaluating {Count} frames for best quality", frameList.Count);
 
-        var qualityScores = new List<FrameQualityScore>();
+        // Frames are independent and evaluation is CPU-bound (decode + Laplacian), so score
+        // them in parallel. EvaluateFrameQualityAsync completes synchronously, so it is
+        // Parallel.ForEachAsync that moves the work onto worker threads; the cap bounds how
+        // many decoded Rgba32 frames are held in memory at once. Results keep frame order.
+        var evaluated = new FrameQualityScore?[frameList.Count];
 
-        for (int i = 0; i < frameList.Count; i++)
+        await Parallel.ForEachAsync(
+            Enumerable.Range(0, frameList.Count),
+            new ParallelOptions { MaxDegreeOfParallelism = _maxParallelFrameEvaluations },
+            async (i, _) => evaluated[i] = await EvaluateFrameQualityAsync(frameList[i], i));
+
+        // Select frame with highest total score in the same pass that skips
+        // undetected frames (first frame wins on ties). NaN scores are skipped too:
+        // they would never compare greater, so a NaN first frame could not be replaced.
+        FrameQualityScore? bestFrame = null;
+
+        foreach (var score in evaluated)
         {
-            var score = await EvaluateFrameQualityAsync(frameList[i], i);
-            if (score != null)
+            if (score == null || double.IsNaN(score.TotalScore))
+            {
+                continue;
+            }
+
+            if (bestFrame == null || score.TotalScore > bestFrame.TotalScore)
             {
-                qualityScores.Add(score);
+                bestFrame = score;
             }
         }
 
-        if (!qualityScores.Any())
+        if (bestFrame == null)
         {
             _logger.LogWarning("No frames with detectable faces");
             return null;
         }
-
-        // Select frame with highest total score
-        var bestFrame = qualityScores.OrderByDescending(s => s.TotalScore).First();
         
         _logger.LogInformation(
             "Selected frame {Index} with score {Score:F2} (FaceSize: {FaceSize:F2}, Sharpness: {Sharpness:F2}, Frontal: {Frontal:F2})",
@@ -79,8 +100,8 @@ public class FaceCapture
         {
             using var image = Image.Load<Rgba32>(imageData);
             
-            // Detect face to get bounds and landmarks
-            var detection = await _faceNormalize.DetectFaceAsync(imageData);
+            // Detect face to get bounds and landmarks (reuses the decoded image)
+            var detection = await _faceNormalize.DetectFaceAsync(image);
             
             if (!detection.FaceDetected)
             {
@@ -122,43 +143,54 @@ public class FaceCapture
     /// <summary>
     /// Calculates image sharpness using variance of Laplacian.
     /// Higher variance indicates sharper edges and better focus.
+    /// Returns 0 for regions too small (under 3x3) to apply the kernel.
     /// </summary>
-    private double CalculateSharpness(Image<Rgba32> image, Models.Rectangle faceBounds)
+    internal double CalculateSharpness(Image<Rgba32> image, Models.Rectangle faceBounds)
     {
         // Extract face region for sharpness calculation
-        var faceRegion = image.Clone(ctx => ctx.Crop(
+        using var faceCrop = image.Clone(ctx => ctx.Crop(
             new SixLabors.ImageSharp.Rectangle(
                 faceBounds.X,
                 faceBounds.Y,
                 faceBounds.Width,
                 faceBounds.Height)));
 
-        // Convert to grayscale for Laplacian calculation
-        faceRegion.Mutate(x => x.Grayscale());
+        // Convert to single-channel luminance for Laplacian calculation
+        // (1 byte per pixel instead of 4, via ImageSharp's bulk pixel conversion)
+        using var faceRegion = faceCrop.CloneAs<L8>();
 
-        // Simple Laplacian approximation using pixel differences
-        double sumSquares = 0;
-        int count = 0;
+        // Simple Laplacian approximation using pixel differences.
+        // Walks three row spans at a time instead of the bounds-checked per-pixel
+        // indexer, and accumulates in integers (the kernel output fits in an int).
+        long sumSquares = 0;
+        long count = (long)Math.Max(0, faceRegion.Width - 2) * Math.Max(0, faceRegion.Height - 2);
 
-        for (int y = 1; y < faceRegion.Height - 1; y++)
+        if (count == 0)
         {
-            for (int x = 1; x < faceRegion.Width - 1; x++)
+            return 0.0;
+        }
+
+        faceRegion.ProcessPixelRows(accessor =>
+        {
+            for (int y = 1; y < accessor.Height - 1; y++)
             {
-                var center = faceRegion[x, y].R;
-                var left = faceRegion[x - 1, y].R;
-                var right = faceRegion[x + 1, y].R;
-                var top = faceRegion[x, y - 1].R;
-                var bottom = faceRegion[x, y + 1].R;
-
-                // Laplacian kernel: center*4 - (left + right + top + bottom)
-                double laplacian = (center * 4) - (left + right + top + bottom);
-                sumSquares += laplacian * laplacian;
-                count++;
+                var above = accessor.GetRowSpan(y - 1);
+                var row = accessor.GetRowSpan(y);
+                var below = accessor.GetRowSpan(y + 1);
+
+                for (int x = 1; x < row.Length - 1; x++)
+                {
+                    // Laplacian kernel: center*4 - (left + right + top + bottom)
+                    int laplacian = (row[x].PackedValue * 4)
+                        - (row[x - 1].PackedValue + row[x + 1].PackedValue
+                            + above[x].PackedValue + below[x].PackedValue);
+                    sumSquares += laplacian * laplacian;
+                }
             }
-        }
+        });
 
         // Normalize variance to 0-1 range (using empirical max of 10000)
-        double variance = sumSquares / count;
+        double variance = (double)sumSquares / count;
         return Math.Min(variance / 10000.0, 1.0);
     }
 
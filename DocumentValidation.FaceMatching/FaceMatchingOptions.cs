@@ -45,4 +45,15 @@ public class FaceMatchingOptions
     /// Delay between frames in milliseconds (default: 100ms for ~1 second total)
     /// </summary>
     public int FrameDelayMs { get; set; } = 100;
+
+    /// <summary>
+    /// Default for <see cref="MaxParallelFrameEvaluations"/>
+    /// </summary>
+    public const int DefaultMaxParallelFrameEvaluations = 2;
+
+    /// <summary>
+    /// Maximum number of burst frames decoded and scored concurrently (default: 2).
+    /// Each frame in flight holds a full decoded image, so this bounds peak memory per request.
+    /// </summary>
+    public int MaxParallelFrameEvaluations { get; set; } = DefaultMaxParallelFrameEvaluations;
 }
@@ -58,22 +58,23 @@ public class FaceMatchingService
             }
 
             // Step 2: Normalize both images
+            // Fail fast: if the selfie cannot be normalized, skip processing the ID photo
             _logger.LogInformation("Step 2: Normalizing selfie");
             var normalizedSelfie = await _faceNormalize.NormalizeFaceAsync(bestSelfie);
             
+            if (normalizedSelfie == null)
+            {
+                _logger.LogWarning("Face normalization failed for selfie");
+                return NormalizationFailedResult();
+            }
+
             _logger.LogInformation("Step 2: Normalizing ID photo");
             var normalizedId = await _faceNormalize.NormalizeFaceAsync(idPhoto);
 
-            if (normalizedSelfie == null || normalizedId == null)
+            if (normalizedId == null)
             {
-                _logger.LogWarning("Face normalization failed");
-                return new VerificationResult
-                {
-                    Decision = Models.VerificationDecision.Retry,
-                    IsIdentical = false,
-                    Confidence = 0.0,
-                    Message = "Could not process images. Please try again."
-                };
+                _logger.LogWarning("Face normalization failed for ID photo");
+                return NormalizationFailedResult();
             }
 
             // Step 3: Verify faces
@@ -104,6 +105,20 @@ public class FaceMatchingService
         }
     }
 
+    /// <summary>
+    /// Result returned when either image cannot be normalized
+    /// </summary>
+    private static VerificationResult NormalizationFailedResult()
+    {
+        return new VerificationResult
+        {
+            Decision = Models.VerificationDecision.Retry,
+            IsIdentical = false,
+            Confidence = 0.0,
+            Message = "Could not process images. Please try again."
+        };
+    }
+
     /// <summary>
     /// Simplified verification with single selfie image (no burst capture).
     /// Useful for testing or when burst capture is not available.
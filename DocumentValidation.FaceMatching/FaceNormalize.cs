@@ -25,12 +25,36 @@ public class FaceNormalize
     /// Uses simple Haar-like cascade approach for lightweight detection.
     /// In production, this would call Azure Face API or similar service.
     /// </summary>
-    public Task<FaceDetectionResult> DetectFaceAsync(byte[] imageData)
+    public async Task<FaceDetectionResult> DetectFaceAsync(byte[] imageData)
+    {
+        Image<Rgba32> image;
+
+        try
+        {
+            image = Image.Load<Rgba32>(imageData);
+        }
+        catch (Exception ex)
+        {
+            // Only decode failures land here; detection errors are handled by the overload below
+            _logger.LogError(ex, "Failed to decode image for face detection");
+            return NoFaceDetectedResult();
+        }
+
+        // Await inside the using so the image outlives detection even if it becomes truly async
+        using (image)
+        {
+            return await DetectFaceAsync(image);
+        }
+    }
+
+    /// <summary>
+    /// Detects face in an already decoded image.
+    /// Lets callers that need the pixels anyway avoid decoding the same bytes twice.
+    /// </summary>
+    public Task<FaceDetectionResult> DetectFaceAsync(Image<Rgba32> image)
     {
         try
         {
-            using var image = Image.Load<Rgba32>(imageData);
-            
             // Simplified face detection using image analysis
             // In production, use Azure Face API or similar service
             var detection = DetectFaceSimple(image);
@@ -40,11 +64,7 @@ public class FaceNormalize
         catch (Exception ex)
         {
             _logger.LogError(ex, "Failed to detect face in image");
-            return Task.FromResult(new FaceDetectionResult 
-            { 
-                FaceDetected = false,
-                FaceBounds = new Models.Rectangle()
-            });
+            return Task.FromResult(NoFaceDetectedResult());
         }
     }
 
@@ -56,16 +76,16 @@ public class FaceNormalize
     {
         try
         {
-            // Detect face
-            var detection = await DetectFaceAsync(imageData);
+            using var image = Image.Load<Rgba32>(imageData);
+
+            // Detect face on the decoded image
+            var detection = await DetectFaceAsync(image);
             
             if (!detection.FaceDetected)
             {
                 _logger.LogWarning("No face detected, cannot normalize");
                 return null;
             }
-
-            using var image = Image.Load<Rgba32>(imageData);
             
             // Crop to face region with some padding
             var croppedImage = CropToFace(image, detection.FaceBounds);
@@ -94,6 +114,18 @@ public class FaceNormalize
         }
     }
 
+    /// <summary>
+    /// Result returned when no face could be detected
+    /// </summary>
+    private static FaceDetectionResult NoFaceDetectedResult()
+    {
+        return new FaceDetectionResult
+        {
+            FaceDetected = false,
+            FaceBounds = new Models.Rectangle()
+        };
+    }
+
     /// <summary>
     /// Simplified face detection for demonstration.
     /// In production, replace with Azure Face API or similar service.
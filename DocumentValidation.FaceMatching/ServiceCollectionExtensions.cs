@@ -20,7 +20,14 @@ public static class ServiceCollectionExtensions
 
         // Register services
         services.AddSingleton<FaceNormalize>();
-        services.AddSingleton<FaceCapture>();
+        services.AddSingleton<FaceCapture>(sp =>
+        {
+            var logger = sp.GetRequiredService<ILogger<FaceCapture>>();
+            return new FaceCapture(
+                logger,
+                sp.GetRequiredService<FaceNormalize>(),
+                options.MaxParallelFrameEvaluations);
+        });
         services.AddSingleton<VerificationDecision>();
         
         services.AddSingleton<FaceVerify>(sp =>